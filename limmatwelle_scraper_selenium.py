@@ -1,7 +1,14 @@
+import hashlib
+import html
 import os
-import time
 import json
 import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
 from pypdf import PdfReader
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,7 +16,19 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from watchdog.observers import Observer
+from watchdog.events import PatternMatchingEventHandler
+
+try:
+    import fitz  # PyMuPDF: C-based and much faster than pypdf
+except ImportError:
+    fitz = None
+
+try:
+    import fcntl  # Profile locking (not available on Windows)
+except ImportError:
+    fcntl = None
 
 
 # ============================================================================
@@ -18,18 +37,26 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 EPAPER_URL = "https://www.limmatwelle.ch/e-paper"
 TARGET_DATE = "22. Mai"
+TARGET_DATES = [TARGET_DATE]  # Add more dates to scrape several editions in one session
 TARGET_PAGES = [12, 13]
 DOWNLOAD_DIR = os.path.abspath("./downloads")
-PDF_FILENAME = "limmatwelle_22_mai.pdf"
+MAX_WORKERS = 4  # Parallel Chrome instances for multiple editions (~200 MB RAM each)
+
+# Known issuu URLs, used when an edition is no longer linked on the e-paper page
+ISSUU_FALLBACK_URLS = {
+    "22. Mai": "https://issuu.com/az-anzeiger/docs/woche_21_limmatwelle_22._mai",
+}
 
 
 # ============================================================================
 # SELENIUM SETUP
 # ============================================================================
 
-def setup_chrome_driver(download_dir: str):
+def setup_chrome_driver(download_dir: str, profile_dir: str = None):
     """
     Setup Chrome WebDriver with download preferences
+    profile_dir: Persistent Chrome profile (defaults to download_dir/chrome_profile),
+                 the caller is responsible for locking it (see lock_profile_dir)
     """
     print("==== Setting up Chrome WebDriver ====")
     
@@ -48,291 +75,409 @@ def setup_chrome_driver(download_dir: str):
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
     
+    # Speed options (we only need the DOM, nothing has to be rendered)
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-translate')
+    chrome_options.add_argument('--disable-sync')
+    chrome_options.add_argument('--disable-default-apps')
+    chrome_options.add_argument('--disable-renderer-backgrounding')
+    chrome_options.add_argument('--disable-backgrounding-occluded-windows')
+    chrome_options.add_argument('--disable-ipc-flooding-protection')
+    chrome_options.add_argument('--mute-audio')
+    chrome_options.add_argument('--no-first-run')
+    chrome_options.add_argument('--disable-notifications')
+    chrome_options.add_argument('--disable-speech-api')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    
+    # Return from driver.get() at DOMContentLoaded instead of window.onload,
+    # the explicit waits below guard every element we need
+    chrome_options.page_load_strategy = "eager"
+    
+    # Persistent profile: the cookie consent and HTTP cache survive between runs
+    if profile_dir is None:
+        profile_dir = os.path.join(download_dir, 'chrome_profile')
+    chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+    chrome_options.add_argument(f'--disk-cache-dir={os.path.join(profile_dir, "cache")}')
+    
     # Set download preferences
     prefs = {
         "download.default_directory": download_dir,
         "download.prompt_for_download": False,
         "download.directory_upgrade": True,
-        "plugins.always_open_pdf_externally": True  # Don't open PDF in browser
+        "plugins.always_open_pdf_externally": True,  # Don't open PDF in browser
+        "profile.managed_default_content_settings.images": 2,  # Don't load images
+        "profile.default_content_setting_values.notifications": 2
     }
     chrome_options.add_experimental_option("prefs", prefs)
     
     # Initialize driver
+    # No implicit wait: it compounds with the explicit WebDriverWaits below
     driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)
+    _configure_cdp(driver, download_dir)
     
     print("==== Chrome WebDriver ready ====")
     return driver
 
 
+def lock_profile_dir(profile_dir: str):
+    """
+    Take an exclusive lock on a Chrome profile directory
+    Holding the lock means no other scraper uses the profile, so Singleton* links left
+    behind by a killed Chrome (e.g. from another container hostname) are removed
+    Returns: Open lock file (keep it open while Chrome runs) or None if locked by another run
+    """
+    if not fcntl:
+        return None
+    
+    os.makedirs(profile_dir, exist_ok=True)
+    lock_file = open(f"{profile_dir}.lock", "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    
+    for name in ('SingletonLock', 'SingletonSocket', 'SingletonCookie'):
+        path = os.path.join(profile_dir, name)
+        if os.path.lexists(path):
+            os.remove(path)
+    return lock_file
+
+
+def _configure_cdp(driver: webdriver.Chrome, download_dir: str):
+    """
+    Allow downloads and block trackers, fonts and media via Chrome DevTools
+    Patterns only match by extension/host, so the issuu PDF download is never blocked
+    """
+    try:
+        # Headless Chrome only saves downloads reliably when this is set explicitly
+        driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+            "behavior": "allow",
+            "downloadPath": download_dir,
+        })
+    except Exception as e:
+        print(f">> Could not set download behavior: {e} <<")
+    
+    blocked_urls = [
+        "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+        "*facebook.net*", "*hotjar*",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*.mp4", "*.webm",
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg",
+    ]
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+    except Exception as e:
+        print(f">> Could not configure URL blocking: {e} <<")
+
+
 # ============================================================================
 # STEP 1: WEB SCRAPING WITH SELENIUM
 # ============================================================================
 
-def scrape_epaper_page_selenium(driver: webdriver.Chrome, url: str, target_date: str):
+def xpath_literal(value: str):
     """
-    Scrape e-paper page to find PDF URL
-    Returns: Issuu PDF URL or None
+    Quote a string for use as an XPath literal
+    Uses concat() when the value contains both quote types
     """
-    try:
-        print(f"Loading e-paper page: {url}")
-        driver.get(url)
-        
-        # Wait for page to load
-        time.sleep(3)
-        
-        print(f"Searching for edition: {target_date}")
-        
-        # Find all links
-        links = driver.find_elements(By.TAG_NAME, "a")
-        
-        for link in links:
-            link_text = link.text.strip()
-            link_href = link.get_attribute("href")
-            
-            if target_date in link_text and link_href and 'issuu.com' in link_href:
-                print(f"Found target edition: {link_text}")
-                print(f"Issuu URL: {link_href}")
-                return link_href
-        
-        print(f"Could not find edition with date: {target_date}")
-        return None
-        
-    except Exception as e:
-        print(f"Error scraping page: {e}")
-        return None
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
 
 
 # ============================================================================
 # STEP 2: DOWNLOAD PDF FROM ISSUU USING SELENIUM
 # ============================================================================
 
-def download_pdf(driver: webdriver.Chrome, issuu_url: str, download_dir: str, timeout: int = 60):
+# Possible cookie accept buttons
+COOKIE_SELECTORS = [
+    "//button[contains(text(), 'Accept')]",
+    "//button[contains(text(), 'Allow')]",
+    "//button[@id='CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll']",
+    "//button[@id='CybotCookiebotDialogBodyButtonAccept']",
+    "//a[contains(@class, 'cookie-accept')]",
+]
+
+# Possible download button selectors (issuu uses different patterns)
+DOWNLOAD_SELECTORS = [
+    "//button[contains(@aria-label, 'Download')]",
+    "//button[contains(text(), 'Download')]",
+    "//a[contains(@aria-label, 'Download')]",
+    "//a[contains(text(), 'Download')]",
+    "//button[contains(@class, 'download')]",
+    "//a[contains(@class, 'download')]",
+    "//*[@data-test-id='download-button']",
+    "//*[contains(@class, 'sc-') and contains(text(), 'Download')]"
+]
+
+# XPath unions, so the browser checks every selector in a single query
+COOKIE_XPATH = " | ".join(COOKIE_SELECTORS)
+DOWNLOAD_XPATH = " | ".join(DOWNLOAD_SELECTORS)
+
+
+def find_cookie_button(driver: webdriver.Chrome):
     """
-    Download PDF from issuu.com
-    Returns: Path to downloaded PDF file or None
+    Wait condition: first visible and enabled cookie accept button, or False
+    Checks every match of the union, so a hidden earlier match doesn't hide a visible one
     """
     try:
-        print(f"\nNavigating to issuu page...")
-        print(f"URL: {issuu_url}")
-        
-        driver.get(issuu_url)
-        
-        # Wait for page to load
-        print("  Waiting for page to load...")
-        time.sleep(5)
-        
-        # IMPORTANT: Handle cookie consent banner first!
-        print("  Checking for cookie consent banner...")
+        for element in driver.find_elements(By.XPATH, COOKIE_XPATH):
+            if element.is_displayed() and element.is_enabled():
+                return element
+    except StaleElementReferenceException:
+        pass
+    return False
+
+
+def find_download_button(driver: webdriver.Chrome):
+    """
+    Wait condition: download button matched by the highest-priority selector, or False
+    Polls with the single union query, selectors are only resolved in order once it matches
+    """
+    if not driver.find_elements(By.XPATH, DOWNLOAD_XPATH):
+        return False
+    for selector in DOWNLOAD_SELECTORS:
+        elements = driver.find_elements(By.XPATH, selector)
+        if elements:
+            return elements[0]
+    return False
+
+
+# Shared HTTP session: keep-alive connections are reused across downloads and workers
+_HTTP = requests.Session()
+_HTTP.headers.update({"User-Agent": "Mozilla/5.0"})
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+def save_response_to_file(response: requests.Response, pdf_path: str):
+    """
+    Stream an HTTP response body to pdf_path if it is a PDF
+    Writes to a temporary file first so a partial download never looks like a finished PDF
+    Returns: True if saved, False if the response is not a PDF
+    """
+    # Undo gzip/deflate transfer encoding when reading the raw stream
+    response.raw.decode_content = True
+    
+    # Accept the body if the server says it's a PDF or it starts with the PDF signature
+    head = response.raw.read(5)
+    content_type = response.headers.get("Content-Type", "")
+    if "application/pdf" not in content_type and not head.startswith(b"%PDF"):
+        print(f">> Response is not a PDF ({content_type or 'no content type'}) <<")
+        return False
+    
+    download_dir = os.path.dirname(pdf_path)
+    os.makedirs(download_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=download_dir, suffix=".part", delete=False) as fh:
         try:
-            # Try to find and click cookie accept button
-            cookie_selectors = [
-                "//button[contains(text(), 'Accept')]",
-                "//button[contains(text(), 'Allow')]",
-                "//button[@id='CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll']",
-                "//button[@id='CybotCookiebotDialogBodyButtonAccept']",
-                "//a[contains(@class, 'cookie-accept')]",
-            ]
-            
-            cookie_handled = False
-            for selector in cookie_selectors:
-                try:
-                    cookie_btn = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    cookie_btn.click()
-                    print("Cookie banner accepted successfully")
-                    time.sleep(2)  # Wait for banner to disappear
-                    cookie_handled = True
-                    break
-                except:
-                    continue
-            
-            if not cookie_handled:
-                print(">> No cookie banner found (or already dismissed) <<")
-        except Exception as e:
-            print(f">> Cookie handling skipped: {e} <<")
-        
-        # Try to find download button
-        print("Looking for download button...")
-        
-        # Possible download button selectors (issuu uses different patterns)
-        download_selectors = [
-            "//button[contains(@aria-label, 'Download')]",
-            "//button[contains(text(), 'Download')]",
-            "//a[contains(@aria-label, 'Download')]",
-            "//a[contains(text(), 'Download')]",
-            "//button[contains(@class, 'download')]",
-            "//a[contains(@class, 'download')]",
-            "//*[@data-test-id='download-button']",
-            "//*[contains(@class, 'sc-') and contains(text(), 'Download')]"
-        ]
-        
-        download_button = None
-        for selector in download_selectors:
-            try:
-                download_button = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.XPATH, selector))
-                )
-                print(f"Found download button with selector: {selector}")
-                break
-            except (NoSuchElementException, TimeoutException):
-                continue
-        
-        if download_button:
-            print("Attempting to click download button...")
-            
-            try:
-                # Method 1: Scroll to element first
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", download_button)
-                time.sleep(1)
-                
-                # Method 2: Use JavaScript click (bypasses overlay issues)
-                print("Using JavaScript click to bypass overlays...")
-                driver.execute_script("arguments[0].click();", download_button)
-                time.sleep(2)
-                
-                print("Download button clicked successfully!")
-                
-            except Exception as click_error:
-                print(f"JavaScript click failed: {click_error}")
-                print("Trying alternative: ActionChains click...")
-                
-                try:
-                    # Method 3: ActionChains with move to element
-                    actions = ActionChains(driver)
-                    actions.move_to_element(download_button).click().perform()
-                    time.sleep(2)
-                    print("ActionChains click successful!")
-                    
-                except Exception as action_error:
-                    print(f"ActionChains also failed: {action_error}")
-                    print("Download button found but cannot click due to overlays")
-            
-            # Wait for download to complete
-            print(f"... Waiting for download to complete (max {timeout}s) ...")
-            downloaded_file = wait_for_download(download_dir, timeout)
+            fh.write(head)
+            shutil.copyfileobj(response.raw, fh, length=1 << 20)
+        except Exception:
+            fh.close()
+            os.remove(fh.name)
+            raise
+    os.replace(fh.name, pdf_path)
+    return True
+
+
+def fetch_pdf_direct(issuu_url: str, download_dir: str, timeout: int = 60):
+    """
+    Try to download the PDF over plain HTTP from issuu's /download endpoint
+    Returns: Path to downloaded PDF file or None if issuu did not serve a PDF
+    """
+    download_url = f"{issuu_url.rstrip('/')}/download"
+    print(f"Trying direct download: {download_url}")
+    
+    try:
+        with _HTTP.get(download_url, allow_redirects=True, stream=True, timeout=timeout) as response:
+            content_type = response.headers.get("Content-Type", "")
+            if response.status_code != 200 or "application/pdf" not in content_type:
+                print(f">> Direct download not available (HTTP {response.status_code}, {content_type or 'no content type'}) <<")
+                return None
             
-            if downloaded_file:
-                print(f"PDF downloaded successfully: {downloaded_file}")
-                return downloaded_file
-            else:
-                print("Download timeout or failed")
+            pdf_name = issuu_url.rstrip('/').rsplit('/', 1)[-1] + ".pdf"
+            pdf_path = os.path.join(download_dir, pdf_name)
+            if not save_response_to_file(response, pdf_path):
                 return None
-        else:
-            print("\n>> Download button not found on issuu page <<")
-            print(">> Issuu might require: <<")
-            print("  >> Login/authentication <<")
-            print("  >> Premium account <<")
-            print("  >> Or the document owner disabled downloads <<")
-            print("\n>> Trying alternative: Extract PDF from viewer... <<")
-            
-            # Alternative: Try to get PDF URL from page source or network
-            return try_extract_pdf_url_from_issuu(driver)
         
-    except Exception as e:
-        print(f"Error downloading from issuu: {e}")
+        print(f"PDF downloaded directly: {pdf_path}")
+        return pdf_path
+        
+    except (requests.RequestException, OSError) as e:
+        print(f">> Direct download failed: {e} <<")
         return None
 
 
-def wait_for_download(download_dir: str, timeout: int = 60):
+def list_pdf_files(download_dir: str):
+    """Return the set of finished PDF filenames in the download directory"""
+    return {f for f in os.listdir(download_dir) if f.endswith('.pdf')}
+
+
+class PdfDownloadHandler(PatternMatchingEventHandler):
     """
-    Wait for file download to complete        
-    Returns: Path to downloaded file or None
+    Watchdog handler that fires once a new PDF appears in the download directory
+    Chrome writes to a .crdownload file and renames it when done, so both
+    created and moved events are handled
     """
-    start_time = time.time()
     
-    while time.time() - start_time < timeout:
-        # Get all files in download directory
-        files = os.listdir(download_dir)
-        
-        # Filter PDF files (exclude .crdownload temporary files)
-        pdf_files = [f for f in files if f.endswith('.pdf') and not f.endswith('.crdownload')]
-        
-        if pdf_files:
-            # Return the most recent PDF file
-            pdf_files.sort(key=lambda x: os.path.getmtime(os.path.join(download_dir, x)), reverse=True)
-            return os.path.join(download_dir, pdf_files[0])
-        
-        # Check if download is in progress
-        temp_files = [f for f in files if f.endswith('.crdownload')]
-        if temp_files:
-            print("Download in progress...", end='\r')
-        
-        time.sleep(1)
+    def __init__(self, existing_files):
+        # No ignore_patterns: a .crdownload -> .pdf move would be ignored as a whole
+        super().__init__(patterns=["*.pdf"], ignore_directories=True)
+        self.existing_files = existing_files
+        self.downloaded_file = None
+        self.done = threading.Event()
+    
+    def _check(self, path: str):
+        if path.endswith('.pdf') and os.path.basename(path) not in self.existing_files:
+            self.downloaded_file = path
+            self.done.set()
     
-    return None
+    def on_created(self, event):
+        self._check(event.src_path)
+    
+    def on_moved(self, event):
+        self._check(event.dest_path)
 
 
-def try_extract_pdf_url_from_issuu(driver: webdriver.Chrome):
+def wait_for_download(download_dir: str, timeout: int = 60, existing_files=None):
     """
-    Try to extract direct PDF URL from issuu page source or network calls
-    Returns: Path to downloaded PDF or None
+    Wait for file download to complete using filesystem events
+    existing_files: PDFs present before the download started (snapshot now if None)
+    Returns: Path to downloaded file or None
     """
+    if existing_files is None:
+        existing_files = list_pdf_files(download_dir)
+    
+    handler = PdfDownloadHandler(existing_files)
+    observer = Observer()
+    observer.schedule(handler, download_dir, recursive=False)
+    observer.start()
+    
     try:
-        print("Reading page source for PDF URL")
+        # The download may have finished before the observer started
+        new_files = list_pdf_files(download_dir) - existing_files
+        if new_files:
+            return os.path.join(download_dir, new_files.pop())
         
-        # Get page source
-        page_source = driver.page_source
-        
-        # Look for PDF URL patterns in page source
-        pdf_patterns = [
-            r'https://[^"\']+\.pdf',
-            r'"pdfUrl":"([^"]+)"',
-            r'"downloadUrl":"([^"]+)"',
-            r'data-pdf-url="([^"]+)"'
-        ]
-        
-        for pattern in pdf_patterns:
-            matches = re.findall(pattern, page_source)
-            if matches:
-                print(f"Found potential PDF URL: {matches[0]}")
-                # Try to download from this URL
-                # This would require additional implementation
-                break
-        
-        print("Could not extract PDF URL automatically")
-        return None
-        
-    except Exception as e:
-        print(f"Error extracting PDF URL: {e}")
-        return None
+        handler.done.wait(timeout)
+        return handler.downloaded_file
+    finally:
+        observer.stop()
+        observer.join()
 
 
 # ============================================================================
 # STEP 3: PDF TEXT EXTRACTION
 # ============================================================================
 
-def extract_text_from_pdf(pdf_path: str, page_numbers):
+def text_cache_path(pdf_path: str, page_numbers):
     """
-    Extract text from specific page(s) of PDF using pypdf        
-    Returns: Extracted text as string (combined if multiple pages)
+    Return the cache file for the text of these pages of this PDF
+    Keyed on the file content, so renamed or re-downloaded copies still hit the cache
     """
-    try:        
-        print(f"\nOpening PDF: {pdf_path}")
-        reader = PdfReader(pdf_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    
+    # The engine is part of the key because pymupdf and pypdf lay out text differently
+    engine = "pymupdf" if fitz else "pypdf"
+    cache_key = f"{digest.hexdigest()}_{engine}_{'_'.join(map(str, page_numbers))}.txt"
+    return os.path.join(os.path.dirname(pdf_path), '.cache', cache_key)
+
+
+def write_text_cache(cache_path: str, text: str):
+    """Write the cache file atomically so an interrupted run never leaves a truncated entry"""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(cache_path),
+                                         suffix=".tmp", delete=False) as fh:
+            fh.write(text)
+        os.replace(fh.name, cache_path)
+    except OSError as e:
+        print(f">> Could not write text cache: {e} <<")
+
+
+def extract_pages_pymupdf(pdf_path: str, page_numbers):
+    """Extract text of the given 1-based pages with PyMuPDF"""
+    all_text = []
+    doc = fitz.open(pdf_path)
+    try:
+        total_pages = doc.page_count
+        print(f"Total pages: {total_pages}")
+        
+        for page_num in page_numbers:
+            if page_num > total_pages:
+                print(f"Page {page_num} exceeds total pages, skipping")
+                continue
+            
+            text = doc.load_page(page_num - 1).get_text("text")
+            all_text.append(text)
+            print(f"Extracted {len(text)} characters from page {page_num}")
+    finally:
+        doc.close()
+    
+    return all_text
+
+
+def extract_pages_pypdf(pdf_path: str, page_numbers):
+    """Extract text of the given 1-based pages with pypdf"""
+    all_text = []
+    with open(pdf_path, 'rb') as fh:
+        # Non-strict: tolerate minor structural issues instead of validating them
+        reader = PdfReader(fh, strict=False)
         
         total_pages = len(reader.pages)
         print(f"Total pages: {total_pages}")
         
-        # Handle both single page and multiple pages
-        if isinstance(page_numbers, int):
-            page_numbers = [page_numbers]
-        
-        all_text = []
         for page_num in page_numbers:
             if page_num > total_pages:
                 print(f"Page {page_num} exceeds total pages, skipping")
                 continue
             
+            # Pages are parsed lazily, only the target pages are decoded
             page = reader.pages[page_num - 1]
-            text = page.extract_text()
+            text = page.extract_text(extraction_mode="plain")
             all_text.append(text)
             print(f"Extracted {len(text)} characters from page {page_num}")
+    
+    return all_text
+
+
+def extract_text_from_pdf(pdf_path: str, page_numbers):
+    """
+    Extract text from specific page(s) of PDF using PyMuPDF (pypdf if not installed)
+    Returns: Extracted text as string (combined if multiple pages)
+    """
+    try:        
+        print(f"\nOpening PDF: {pdf_path}")
+        
+        # Handle both single page and multiple pages
+        if isinstance(page_numbers, int):
+            page_numbers = [page_numbers]
+        
+        # Reuse text extracted by an earlier run on the same PDF
+        cache_path = text_cache_path(pdf_path, page_numbers)
+        if os.path.exists(cache_path):
+            with open(cache_path, encoding="utf-8") as f:
+                combined_text = f.read()
+            print(f"Using cached text: {cache_path}")
+            return combined_text
+        
+        if fitz:
+            all_text = extract_pages_pymupdf(pdf_path, page_numbers)
+        else:
+            all_text = extract_pages_pypdf(pdf_path, page_numbers)
         
         combined_text = "\n\n--- PAGE BREAK ---\n\n".join(all_text)
         print(f"Total extracted: {len(combined_text)} characters from {len(all_text)} page(s)")
         
+        write_text_cache(cache_path, combined_text)
+        
         return combined_text
         
     except ImportError:
@@ -347,6 +492,68 @@ def extract_text_from_pdf(pdf_path: str, page_numbers):
 # STEP 4: DATA PARSING
 # ============================================================================
 
+# Patterns are compiled once and reused for every section
+_PUBLICATION_RE = re.compile(r'Baugesuchspublikation', re.IGNORECASE)
+_WURENLOS_RE = re.compile(r'W[üÜu]renlos', re.IGNORECASE)
+_BAUGESUCH_NR_RE = re.compile(r'Baugesuch\s*Nr\.?:?\s*(\d+)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_BAUHERR_RE = re.compile(r'Bauherrschaft:?\s*(.*?)(?=Bauvorhaben:|$)', re.IGNORECASE | re.DOTALL)
+_BAUVOR_RE = re.compile(r'Bauvorhaben:?\s*(.*?)(?=Lage:|$)', re.IGNORECASE | re.DOTALL)
+_LAGE_RE = re.compile(r'Lage:?\s*(.*?)(?=Zone:|$)', re.IGNORECASE | re.DOTALL)
+_ZONE_RE = re.compile(r'Zone:?\s*(.*?)(?=Zusatzgesuch:|$)', re.IGNORECASE | re.DOTALL)
+_ZUSATZ_RE = re.compile(r'Zusatzgesuch:?\s*(.*?)(?=Gesuchsauflage|$)', re.IGNORECASE | re.DOTALL)
+_OTHERS_RE = re.compile(r'(Gesuchsauflage.*?)(?=BAUVERWALTUNG|$)', re.IGNORECASE | re.DOTALL)
+_FIELD_RES = {
+    'bauherr': _BAUHERR_RE,
+    'bauvor': _BAUVOR_RE,
+    'lage': _LAGE_RE,
+    'zone': _ZONE_RE,
+    'zusatz': _ZUSATZ_RE,
+    'others': _OTHERS_RE,
+}
+
+# All fields in document order, matched in a single pass over the section
+_SECTION_RE = re.compile(
+    r'Bauherrschaft:?\s*(?P<bauherr>.*?)(?=Bauvorhaben:)'
+    r'Bauvorhaben:?\s*(?P<bauvor>.*?)(?=Lage:)'
+    r'Lage:?\s*(?P<lage>.*?)(?=Zone:)'
+    r'Zone:?\s*(?P<zone>.*?)'
+    r'(?:(?=Zusatzgesuch:)Zusatzgesuch:?\s*(?P<zusatz>.*?))?'
+    r'(?P<others>Gesuchsauflage.*?)?'
+    r'(?=BAUVERWALTUNG|\Z)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Line prefixes that end a multi-line field
+_BAUHERR_STOP_RE = re.compile(r'^(Bauvorhaben|Lage|Zone|Zusatzgesuch):', re.IGNORECASE)
+_BAUVOR_STOP_RE = re.compile(r'^(Lage|Zone|Bauherrschaft):', re.IGNORECASE)
+_LAGE_STOP_RE = re.compile(r'^(Zone|Zusatzgesuch):', re.IGNORECASE)
+_ZONE_STOP_RE = re.compile(r'^(Zusatzgesuch|Gesuchsauflage):', re.IGNORECASE)
+_ZUSATZ_STOP_RE = re.compile(r'^Gesuchsauflage', re.IGNORECASE)
+
+# Mojibake: a two-byte UTF-8 character (umlauts, accents) decoded as Windows-1252
+_MOJIBAKE_RE = re.compile(r'[ÂÃ].')
+
+
+def fix_mojibake(text: str):
+    """Re-decode mojibake character pairs as UTF-8, leaving all other text untouched"""
+    if 'Ã' not in text and 'Â' not in text:
+        return text
+    
+    def decode_pair(match):
+        pair = match.group(0)
+        if pair == 'Ã ':
+            # 'à' is Ã + non-breaking space, which PDF extraction turns into a plain space
+            return 'à'
+        try:
+            return pair.encode('cp1252').decode('utf-8')
+        except UnicodeError:
+            return pair
+    
+    return _MOJIBAKE_RE.sub(decode_pair, text)
+
+
 def find_baugesuch_sections(text: str):
     """Find all Baugesuch sections from Gemeinde Wurenlos"""
     print("\nSearching for Baugesuch from Gemeinde Wurenlos...")
@@ -354,27 +561,25 @@ def find_baugesuch_sections(text: str):
     sections = []
     
     # Simple pattern: Find "Baugesuchspublikation" followed by section until next "Baugesuchspublikation" or "BAUVERWALTUNG"
-    # Split by these markers
-    parts = re.split(r'(Baugesuchspublikation)', text, flags=re.IGNORECASE)
-    
-    # Reconstruct sections
-    for i in range(1, len(parts), 2):
-        if i+1 < len(parts):
-            section = parts[i] + parts[i+1]
-            
-            # Check if this section contains Würenlos (handle encoding variants)
-            if re.search(r'W[üÜu]renlos', section, re.IGNORECASE):
-                # Also check for BAUVERWALTUNGWÜRENLOS at the end
-                if 'BAUVERWALTUNG' in section.upper():
-                    # Split at BAUVERWALTUNG to get just this section
-                    section = section.split('BAUVERWALTUNG')[0] + 'BAUVERWALTUNGWÜRENLOS'
-                
-                sections.append(section)
-                
-                # Extract Baugesuch Nr for logging
-                nr_match = re.search(r'BaugesuchNr\.?:?\s*(\d+)', section)
-                if nr_match:
-                    print(f"    Found Baugesuch Nr. {nr_match.group(1)}")
+    # Slice the text between marker positions
+    positions = [m.start() for m in _PUBLICATION_RE.finditer(text)] + [len(text)]
+    
+    for start, end in zip(positions, positions[1:]):
+        section = text[start:end]
+        
+        # Check if this section contains Würenlos (handle encoding variants)
+        if _WURENLOS_RE.search(section):
+            # Also check for BAUVERWALTUNGWÜRENLOS at the end
+            if 'BAUVERWALTUNG' in section.upper():
+                # Split at BAUVERWALTUNG to get just this section
+                section = section.split('BAUVERWALTUNG')[0] + 'BAUVERWALTUNGWÜRENLOS'
+            
+            sections.append(section)
+            
+            # Extract Baugesuch Nr for logging
+            nr_match = _BAUGESUCH_NR_RE.search(section)
+            if nr_match:
+                print(f"    Found Baugesuch Nr. {nr_match.group(1)}")
     
     print(f">> Found {len(sections)} Baugesuch section(s) <<")
     return sections
@@ -392,96 +597,76 @@ def extract_field(text: str, field: str):
     return ""
 
 
+def collect_field_lines(text: str, stop_re):
+    """Collect stripped lines of a field until an empty line or the next field label"""
+    lines = []
+    for line in text.strip().split('\n'):
+        line = line.strip()
+        if line and not stop_re.match(line):
+            lines.append(line)
+        else:
+            break
+    return lines
+
+
 def parse_baugesuch(section: str):
     """Parse one Baugesuch section"""
     data = {}
     
     # Fix encoding issues first
-    section = section.replace('Ãœ', 'Ü').replace('Ã¤', 'ä').replace('Ã¶', 'ö').replace('Ã–', 'Ö').replace('Ã„', 'Ä')
-    section = section.replace('Ã©', 'é').replace('Ã¨', 'è').replace('Ã ', 'à')
+    section = fix_mojibake(section)
     
     # Baugesuch Nr
-    nr_match = re.search(r'BaugesuchNr\.?:?\s*(\d+)', section, re.IGNORECASE)
+    nr_match = _BAUGESUCH_NR_RE.search(section)
     if nr_match:
         data['Baugesuch_Nr'] = nr_match.group(1)
     
+    # Extract all fields in one pass; fall back to one search per field
+    # when the section does not follow the usual field order
+    section_match = _SECTION_RE.search(section)
+    if section_match:
+        fields = section_match.groupdict()
+    else:
+        fields = {}
+        for name, field_re in _FIELD_RES.items():
+            field_match = field_re.search(section)
+            fields[name] = field_match.group(1) if field_match else None
+    
     # Extract Bauherrschaft - may span multiple lines
-    bauherr_match = re.search(r'Bauherrschaft:?\s*(.*?)(?=Bauvorhaben:|$)', section, re.IGNORECASE | re.DOTALL)
-    if bauherr_match:
-        text = bauherr_match.group(1).strip()
-        # Take only up to next field or reasonable length
-        lines = []
-        for line in text.split('\n'):
-            line = line.strip()
-            if line and not re.match(r'^(Bauvorhaben|Lage|Zone|Zusatzgesuch):', line, re.IGNORECASE):
-                lines.append(line)
-            else:
-                break
+    if fields['bauherr'] is not None:
+        lines = collect_field_lines(fields['bauherr'], _BAUHERR_STOP_RE)
         if lines:
             data['Bauherrschaft'] = ','.join(lines)
     
     # Extract Bauvorhaben - may span multiple lines
-    bauvor_match = re.search(r'Bauvorhaben:?\s*(.*?)(?=Lage:|$)', section, re.IGNORECASE | re.DOTALL)
-    if bauvor_match:
-        text = bauvor_match.group(1).strip()
-        lines = []
-        for line in text.split('\n'):
-            line = line.strip()
-            if line and not re.match(r'^(Lage|Zone|Bauherrschaft):', line, re.IGNORECASE):
-                lines.append(line)
-            else:
-                break
+    if fields['bauvor'] is not None:
+        lines = collect_field_lines(fields['bauvor'], _BAUVOR_STOP_RE)
         if lines:
             data['Bauvorhaben'] = ' '.join(lines)
     
     # Extract Lage
-    lage_match = re.search(r'Lage:?\s*(.*?)(?=Zone:|$)', section, re.IGNORECASE | re.DOTALL)
-    if lage_match:
-        text = lage_match.group(1).strip()
-        lines = []
-        for line in text.split('\n'):
-            line = line.strip()
-            if line and not re.match(r'^(Zone|Zusatzgesuch):', line, re.IGNORECASE):
-                lines.append(line)
-            else:
-                break
+    if fields['lage'] is not None:
+        lines = collect_field_lines(fields['lage'], _LAGE_STOP_RE)
         if lines:
             data['Lage'] = ','.join(lines)
     
     # Extract Zone
-    zone_match = re.search(r'Zone:?\s*(.*?)(?=Zusatzgesuch:|$)', section, re.IGNORECASE | re.DOTALL)
-    if zone_match:
-        text = zone_match.group(1).strip()
-        lines = []
-        for line in text.split('\n'):
-            line = line.strip()
-            if line and not re.match(r'^(Zusatzgesuch|Gesuchsauflage):', line, re.IGNORECASE):
-                lines.append(line)
-            else:
-                break
+    if fields['zone'] is not None:
+        lines = collect_field_lines(fields['zone'], _ZONE_STOP_RE)
         if lines:
             data['Zone'] = lines[0]  # Usually single line
     
     # Extract Zusatzgesuch
-    zusatz_match = re.search(r'Zusatzgesuch:?\s*(.*?)(?=Gesuchsauflage|$)', section, re.IGNORECASE | re.DOTALL)
-    if zusatz_match:
-        text = zusatz_match.group(1).strip()
-        lines = []
-        for line in text.split('\n'):
-            line = line.strip()
-            if line and not re.match(r'^Gesuchsauflage', line, re.IGNORECASE):
-                lines.append(line)
-            else:
-                break
+    if fields['zusatz'] is not None:
+        lines = collect_field_lines(fields['zusatz'], _ZUSATZ_STOP_RE)
         if lines:
             data['Zusatzgesuch'] = ','.join(lines)
     
     # Extract "others" - Gesuchsauflage text
-    others_match = re.search(r'(Gesuchsauflage.*?)(?=BAUVERWALTUNG|$)', section, re.IGNORECASE | re.DOTALL)
-    if others_match:
-        others = others_match.group(1).strip()
+    if fields['others'] is not None:
+        others = fields['others'].strip()
         # Clean up excessive whitespace but preserve some structure
-        others = re.sub(r'\s+', ' ', others)
+        others = _WHITESPACE_RE.sub(' ', others)
         # Limit length if too long
         if len(others) > 500:
             others = others[:500] + '...'
@@ -491,74 +676,367 @@ def parse_baugesuch(section: str):
 
 
 # ============================================================================
-# MAIN EXECUTION
+# SCRAPER SESSION
 # ============================================================================
 
-def main():
-    """Main execution function"""
+def edition_slug(target_date: str):
+    """Turn an edition date like '22. Mai' into a filename part like '22_mai'"""
+    return re.sub(r'\W+', '_', target_date.lower()).strip('_')
+
+
+class LimmatwelleScraper:
+    """
+    Scrape one or more editions while sharing a single Chrome session
+    Chrome is started on first use, so editions already on disk never launch it
     
-    driver = None
+    output_dir: Where PDFs, raw text, the text cache and the Chrome profile are kept
+    download_dir: Where Chrome saves downloads (defaults to output_dir); finished
+                  PDFs are moved from there into output_dir
     
-    try:
-        # Setup Selenium
-        driver = setup_chrome_driver(DOWNLOAD_DIR)
-        
-        # STEP 1: Scrape website for PDF URL
-        print("\n" + "="*70)
-        print("[STEP 1] Scraping website for PDF URL...")
-        print("="*70)
-        
-        issuu_url = scrape_epaper_page_selenium(driver, EPAPER_URL, TARGET_DATE)
-        
-        if not issuu_url:
-            print("\n   Could not find PDF URL via Selenium")
-            print("  Using known issuu URL as fallback...")
-            issuu_url = "https://issuu.com/az-anzeiger/docs/woche_21_limmatwelle_22._mai"
-        
-        # STEP 2: Download PDF from issuu
-        print("\n" + "="*70)
-        print("[STEP 2] Downloading PDF from issuu...")
-        print("="*70)
-        
-        pdf_path = download_pdf(driver, issuu_url, DOWNLOAD_DIR)
+    Usage:
+        with LimmatwelleScraper(DOWNLOAD_DIR) as scraper:
+            scraper.scrape_edition("22. Mai", [12, 13])
+    """
+    
+    def __init__(self, output_dir: str, download_dir: str = None):
+        self.output_dir = output_dir
+        self.download_dir = download_dir or output_dir
+        self._driver = None
+        self._profile_lock = None
+        self._temp_profile_dir = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    @property
+    def driver(self):
+        if self._driver is None:
+            # Chrome refuses to start on a profile that is in use, so a concurrent run
+            # (or another worker) gets a throwaway profile instead
+            profile_dir = os.path.join(self.output_dir, 'chrome_profile')
+            self._profile_lock = lock_profile_dir(profile_dir)
+            if fcntl and self._profile_lock is None:
+                print(">> Chrome profile is in use by another run, using a temporary profile <<")
+            else:
+                try:
+                    self._driver = setup_chrome_driver(self.download_dir, profile_dir)
+                except Exception as e:
+                    # A broken persistent profile must not block every later run
+                    print(f">> Chrome failed to start with the saved profile ({e}), using a temporary profile <<")
+                    self._release_profile()
+            
+            if self._driver is None:
+                self._temp_profile_dir = tempfile.mkdtemp(prefix='chrome_profile_')
+                try:
+                    self._driver = setup_chrome_driver(self.download_dir, self._temp_profile_dir)
+                except Exception:
+                    self._release_profile()
+                    raise
+        return self._driver
+    
+    def _release_profile(self):
+        """Release the profile lock and delete a temporary profile"""
+        if self._profile_lock:
+            self._profile_lock.close()
+            self._profile_lock = None
+        if self._temp_profile_dir:
+            shutil.rmtree(self._temp_profile_dir, ignore_errors=True)
+            self._temp_profile_dir = None
+    
+    def close(self):
+        """Close the browser if it was started"""
+        try:
+            if self._driver:
+                print("\n  Closing browser...")
+                self._driver.quit()
+                print("  Browser closed")
+        finally:
+            self._driver = None
+            self._release_profile()
+    
+    def scrape_epaper_page_selenium(self, url: str, target_date: str):
+        """
+        Scrape e-paper page to find PDF URL
+        Returns: Issuu PDF URL or None
+        """
+        try:
+            print(f"Loading e-paper page: {url}")
+            self.driver.get(url)
+            
+            # Wait until the edition links are rendered
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_all_elements_located((By.XPATH, "//a[contains(@href,'issuu.com')]"))
+                )
+            except TimeoutException:
+                print("No issuu links appeared on the page")
+                return None
+            
+            print(f"Searching for edition: {target_date}")
+            
+            # Let the browser filter the links instead of inspecting each one from Python
+            links = self.driver.find_elements(
+                By.XPATH,
+                f"//a[contains(@href,'issuu.com') and contains(., {xpath_literal(target_date)})]"
+            )
+            
+            if links:
+                link_href = links[0].get_attribute("href")
+                print(f"Found target edition: {target_date}")
+                print(f"Issuu URL: {link_href}")
+                return link_href
+            
+            print(f"Could not find edition with date: {target_date}")
+            return None
+            
+        except Exception as e:
+            print(f"Error scraping page: {e}")
+            return None
+    
+    def download_pdf(self, issuu_url: str, timeout: int = 60):
+        """
+        Download PDF from issuu.com
+        Returns: Path to downloaded PDF file or None
+        """
+        # Plain HTTP is much faster than driving the viewer, try it first
+        pdf_path = fetch_pdf_direct(issuu_url, self.download_dir, timeout)
+        if pdf_path:
+            return pdf_path
         
-        if not pdf_path:
-            print("\n   Automatic download failed")
-            print("  Please download manually:")
-            print(f"   1. Visit: {issuu_url}")
-            print(f"   2. Download the PDF")
-            print(f"   3. Place it in: {DOWNLOAD_DIR}/{PDF_FILENAME}")
-            
-            # Check if PDF already exists
-            manual_pdf_path = os.path.join(DOWNLOAD_DIR, PDF_FILENAME)
-            if os.path.exists(manual_pdf_path):
-                print(f"\n  Found existing PDF: {manual_pdf_path}")
-                pdf_path = manual_pdf_path
+        try:
+            print(f"\nNavigating to issuu page...")
+            print(f"URL: {issuu_url}")
+            
+            self.driver.get(issuu_url)
+            
+            # Wait for the DOM (not subresources), the button waits below do the rest
+            print("  Waiting for page to load...")
+            WebDriverWait(self.driver, 15).until(
+                lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+            )
+            
+            # IMPORTANT: Handle cookie consent banner first!
+            # Consent stored in the profile (Cookiebot's cookie) means no banner to wait for
+            print("  Checking for cookie consent banner...")
+            try:
+                if self.driver.get_cookie('CookieConsent'):
+                    print("Cookie consent already stored in profile, skipping banner")
+                else:
+                    # Try to find and click cookie accept button (one wait for all selectors)
+                    try:
+                        cookie_btn = WebDriverWait(self.driver, 3).until(find_cookie_button)
+                    except TimeoutException:
+                        cookie_btn = None
+                    
+                    if cookie_btn:
+                        cookie_btn.click()
+                        print("Cookie banner accepted successfully")
+                        # Wait for banner to disappear
+                        try:
+                            WebDriverWait(self.driver, 5).until(
+                                EC.invisibility_of_element_located((By.ID, 'CybotCookiebotDialog'))
+                            )
+                        except TimeoutException:
+                            print(">> Cookie banner still visible, continuing anyway <<")
+                    else:
+                        print(">> No cookie banner found (or already dismissed) <<")
+            except Exception as e:
+                print(f">> Cookie handling skipped: {e} <<")
+            
+            # Try to find download button
+            print("Looking for download button...")
+            
+            # One wait for all selectors: fails after 8s instead of 2s per selector
+            try:
+                download_button = WebDriverWait(self.driver, 8).until(find_download_button)
+                print("Found download button")
+            except (NoSuchElementException, TimeoutException):
+                download_button = None
+            
+            if download_button:
+                print("Attempting to click download button...")
+                
+                # Snapshot existing PDFs so an earlier download is not mistaken for this one
+                existing_files = list_pdf_files(self.download_dir)
+                
+                try:
+                    # Method 1: Scroll to element first
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", download_button)
+                    try:
+                        WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(download_button))
+                    except TimeoutException:
+                        # JavaScript click below does not need the element to be clickable
+                        pass
+                    
+                    # Method 2: Use JavaScript click (bypasses overlay issues)
+                    print("Using JavaScript click to bypass overlays...")
+                    self.driver.execute_script("arguments[0].click();", download_button)
+                    
+                    print("Download button clicked successfully!")
+                    
+                except Exception as click_error:
+                    print(f"JavaScript click failed: {click_error}")
+                    print("Trying alternative: ActionChains click...")
+                    
+                    try:
+                        # Method 3: ActionChains with move to element
+                        actions = ActionChains(self.driver)
+                        actions.move_to_element(download_button).click().perform()
+                        print("ActionChains click successful!")
+                        
+                    except Exception as action_error:
+                        print(f"ActionChains also failed: {action_error}")
+                        print("Download button found but cannot click due to overlays")
+                
+                # Wait for download to complete
+                print(f"... Waiting for download to complete (max {timeout}s) ...")
+                downloaded_file = wait_for_download(self.download_dir, timeout, existing_files)
+                
+                if downloaded_file:
+                    print(f"PDF downloaded successfully: {downloaded_file}")
+                    return downloaded_file
+                else:
+                    print("Download timeout or failed")
+                    return None
             else:
-                print("\n  PDF not found. Exiting.")
-                return
+                print("\n>> Download button not found on issuu page <<")
+                print(">> Issuu might require: <<")
+                print("  >> Login/authentication <<")
+                print("  >> Premium account <<")
+                print("  >> Or the document owner disabled downloads <<")
+                print("\n>> Trying alternative: Extract PDF from viewer... <<")
+                
+                # Alternative: Try to get PDF URL from page source or network
+                return self.try_extract_pdf_url_from_issuu()
+            
+        except Exception as e:
+            print(f"Error downloading from issuu: {e}")
+            return None
+    
+    def try_extract_pdf_url_from_issuu(self):
+        """
+        Try to extract direct PDF URL from issuu page source or network calls
+        Returns: Path to downloaded PDF or None
+        """
+        try:
+            print("Reading page source for PDF URL")
+            
+            # Get page source
+            page_source = self.driver.page_source
+            
+            # Look for PDF URL patterns in page source
+            # Only document-specific fields are downloaded, see the catch-all below
+            pdf_patterns = [
+                r'"pdfUrl":"([^"]+)"',
+                r'"downloadUrl":"([^"]+)"',
+                r'data-pdf-url="([^"]+)"'
+            ]
+            
+            tried_urls = set()
+            for pattern in pdf_patterns:
+                for match in re.findall(pattern, page_source):
+                    # URLs inside JSON blobs are escaped as https:\/\/..., in attributes as &amp;
+                    pdf_url = html.unescape(match.replace('\\/', '/'))
+                    if pdf_url in tried_urls:
+                        continue
+                    tried_urls.add(pdf_url)
+                    print(f"Found potential PDF URL: {pdf_url}")
+                    
+                    pdf_path = os.path.join(self.download_dir, "issuu_extracted.pdf")
+                    try:
+                        with _HTTP.get(pdf_url, stream=True, timeout=60) as response:
+                            response.raise_for_status()
+                            saved = save_response_to_file(response, pdf_path)
+                        if saved:
+                            print(f"PDF downloaded from extracted URL: {pdf_path}")
+                            return pdf_path
+                    except (requests.RequestException, OSError) as e:
+                        print(f">> Download from extracted URL failed: {e} <<")
+            
+            # Any other .pdf link may be terms or another document, so it is only reported
+            for match in re.findall(r'https://[^"\']+\.pdf', page_source):
+                pdf_url = html.unescape(match.replace('\\/', '/'))
+                if pdf_url not in tried_urls:
+                    print(f"Found other PDF link (not downloaded): {pdf_url}")
+                    break
+            
+            print("Could not extract PDF URL automatically")
+            return None
+            
+        except Exception as e:
+            print(f"Error extracting PDF URL: {e}")
+            return None
+    
+    def scrape_edition(self, target_date: str, target_pages):
+        """
+        Run steps 1-4 for one edition
+        Returns: List of parsed Baugesuch dicts or None if the PDF could not be processed
+        """
+        pdf_filename = f"limmatwelle_{edition_slug(target_date)}.pdf"
         
-        # Rename downloaded file to standard name
-        if pdf_path and os.path.basename(pdf_path) != PDF_FILENAME:
-            new_path = os.path.join(DOWNLOAD_DIR, PDF_FILENAME)
-            os.rename(pdf_path, new_path)
-            pdf_path = new_path
-            print(f"  Renamed PDF to: {PDF_FILENAME}")
+        # Skip the browser entirely if the PDF was already downloaded
+        existing_pdf_path = os.path.join(self.output_dir, pdf_filename)
+        if os.path.exists(existing_pdf_path) and os.path.getsize(existing_pdf_path) > 0:
+            print(f"\n  Found existing PDF: {existing_pdf_path}")
+            print("  Skipping steps 1 and 2")
+            pdf_path = existing_pdf_path
+        else:
+            # STEP 1: Scrape website for PDF URL
+            print("\n" + "="*70)
+            print(f"[STEP 1] Scraping website for PDF URL ({target_date})...")
+            print("="*70)
+            
+            issuu_url = self.scrape_epaper_page_selenium(EPAPER_URL, target_date)
+            
+            if not issuu_url:
+                print("\n   Could not find PDF URL via Selenium")
+                issuu_url = ISSUU_FALLBACK_URLS.get(target_date)
+                if not issuu_url:
+                    print("  No known issuu URL for this edition. Skipping.")
+                    return None
+                print("  Using known issuu URL as fallback...")
+            
+            # STEP 2: Download PDF from issuu
+            print("\n" + "="*70)
+            print("[STEP 2] Downloading PDF from issuu...")
+            print("="*70)
+            
+            pdf_path = self.download_pdf(issuu_url)
+            
+            if not pdf_path:
+                print("\n   Automatic download failed")
+                print("  Please download manually:")
+                print(f"   1. Visit: {issuu_url}")
+                print(f"   2. Download the PDF")
+                print(f"   3. Place it in: {self.output_dir}/{pdf_filename}")
+                print("\n  PDF not found. Skipping.")
+                return None
+            
+            # Move downloaded file to its standard name in the output directory
+            new_path = os.path.join(self.output_dir, pdf_filename)
+            if pdf_path != new_path:
+                os.replace(pdf_path, new_path)
+                pdf_path = new_path
+                print(f"  Renamed PDF to: {pdf_filename}")
         
         # STEP 3: Extract text from PDF
         print("\n" + "="*70)
-        print(f"[STEP 3] Extracting text from page(s) {TARGET_PAGES}...")
+        print(f"[STEP 3] Extracting text from page(s) {target_pages}...")
         print("="*70)
         
-        page_text = extract_text_from_pdf(pdf_path, TARGET_PAGES)
+        page_text = extract_text_from_pdf(pdf_path, target_pages)
         
         if not page_text:
             print("  Failed to extract text from PDF")
-            return
+            return None
         
         # Save raw text for debugging
-        page_label = "_".join(map(str, TARGET_PAGES)) if isinstance(TARGET_PAGES, list) else str(TARGET_PAGES)
-        raw_text_path = os.path.join(DOWNLOAD_DIR, f"page_{page_label}_raw.txt")
+        page_label = "_".join(map(str, target_pages)) if isinstance(target_pages, list) else str(target_pages)
+        raw_text_path = os.path.join(self.output_dir, f"{os.path.splitext(pdf_filename)[0]}_page_{page_label}_raw.txt")
         with open(raw_text_path, "w", encoding="utf-8") as f:
             f.write(page_text)
         print(f"  Raw text saved: {raw_text_path}")
@@ -578,13 +1056,75 @@ def main():
                 results.append(data)
                 print(f"  Extracted data from Baugesuch #{i}")
         
+        print(f"\n  Edition {target_date}: {len(results)} Baugesuch extracted")
+        print(f"  PDF location: {pdf_path}")
+        print(f"  Raw text: {raw_text_path}")
+        if not results:
+            print(f"  Check {raw_text_path} for debugging")
+        
+        return results
+
+
+def _scrape_batch(target_dates, target_pages, download_dir: str):
+    """
+    Scrape a batch of editions in one browser session (runs in a worker thread)
+    Chrome downloads into download_dir, all results end up in DOWNLOAD_DIR
+    Returns: Dict mapping target date to its results
+    """
+    batch_results = {}
+    with LimmatwelleScraper(DOWNLOAD_DIR, download_dir) as scraper:
+        for target_date in target_dates:
+            batch_results[target_date] = scraper.scrape_edition(target_date, target_pages)
+    return batch_results
+
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def main():
+    """Main execution function"""
+    
+    try:
+        # Spread editions over parallel workers, each with its own browser session.
+        # Workers get separate Chrome download directories so their downloads can't be
+        # mixed up; finished PDFs are moved to DOWNLOAD_DIR, so an edition's files don't
+        # depend on which worker handled it
+        worker_count = max(1, min(MAX_WORKERS, len(TARGET_DATES)))
+        batches = [TARGET_DATES[i::worker_count] for i in range(worker_count)]
+        if worker_count == 1:
+            download_dirs = [DOWNLOAD_DIR]
+        else:
+            download_dirs = [os.path.join(DOWNLOAD_DIR, f"worker_{i}") for i in range(worker_count)]
+        
+        edition_results = {}
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                executor.submit(_scrape_batch, batch, TARGET_PAGES, download_dir)
+                for batch, download_dir in zip(batches, download_dirs)
+            ]
+            for future, batch in zip(futures, batches):
+                try:
+                    edition_results.update(future.result())
+                except Exception as e:
+                    # Keep the results of the other workers
+                    print(f"\n  Worker for {', '.join(batch)} failed: {e}")
+                    import traceback
+                    traceback.print_exc()
+        
+        # Merge results in the configured edition order
+        all_results = []
+        for target_date in TARGET_DATES:
+            if edition_results.get(target_date):
+                all_results.extend(edition_results[target_date])
+        
         # STEP 5: Output results
-        if results:
+        if all_results:
             print("\n" + "="*70)
             print("  FINAL JSON OUTPUT")
             print("="*70)
             
-            output = json.dumps(results, ensure_ascii=False, indent=2)
+            output = json.dumps(all_results, ensure_ascii=False, indent=2)
             print(output)
             
             # output_file = "baugesuch_output.json"
@@ -597,26 +1137,16 @@ def main():
             print("\n" + "="*70)
             print("  SCRAPING COMPLETED SUCCESSFULLY!")
             print("="*70)
-            print(f"  Total Baugesuch extracted: {len(results)}")
-            print(f"  PDF location: {pdf_path}")
-            print(f"  Raw text: {raw_text_path}")
+            print(f"  Total Baugesuch extracted: {len(all_results)}")
             print(f"  JSON output: {output_file}")
         else:
             print("\n  No Baugesuch data extracted")
-            print(f"  Check {raw_text_path} for debugging")
         
     except Exception as e:
         print(f"\n  Fatal error: {e}")
         import traceback
         traceback.print_exc()
-        
-    finally:
-        # Close browser
-        if driver:
-            print("\n  Closing browser...")
-            driver.quit()
-            print("  Browser closed")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()